@@ -6,7 +6,13 @@ modified via the workspace API) and WorkspaceClient for group lookup.
 
 from __future__ import annotations
 
+import functools
+import json
 import os
+import time
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, cast
 
 from databricks.sdk import AccountClient, WorkspaceClient
 from databricks.sdk.service.iam import (
@@ -24,17 +30,67 @@ WORKSHOP_GROUP = "aircraft_workshop_group"
 
 _BATCH_SIZE = 50
 
+# Group name -> ID lookups remembered across CLI invocations (see require_group).
+_GROUP_CACHE = Path.home() / ".cache" / "databricks_setup" / "groups.json"
+_GROUP_CACHE_TTL = 60  # seconds
+
 
 def find_group(client: WorkspaceClient, group_name: str) -> Group | None:
-    """Find a workspace group by display name."""
-    results = list(client.groups.list(filter=f'displayName eq "{group_name}"'))
-    if results:
-        return results[0]
+    """Find a workspace group by display name.
+
+    Takes the first match without draining the paginator.
+    """
+    return next(iter(client.groups.list(filter=f'displayName eq "{group_name}"')), None)
+
+
+def _read_group_cache() -> dict[str, dict[str, Any]]:
+    """Return the on-disk group cache, or ``{}`` if it is missing or malformed."""
+    try:
+        data = json.loads(_GROUP_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return cast(dict[str, dict[str, Any]], data)
+
+
+def _cached_group_id(key: str) -> str | None:
+    entry = _read_group_cache().get(key)
+    if not isinstance(entry, dict):
+        return None
+    group_id, at = entry.get("id"), entry.get("at")
+    if (
+        isinstance(group_id, str)
+        and isinstance(at, (int, float))
+        and time.time() - at < _GROUP_CACHE_TTL
+    ):
+        return group_id
     return None
 
 
+def _remember_group_id(key: str, group_id: str) -> None:
+    cache = _read_group_cache()
+    cache[key] = {"id": group_id, "at": time.time()}
+    try:
+        _GROUP_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _GROUP_CACHE.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError:
+        pass  # the cache is an optimisation only
+
+
 def require_group(client: WorkspaceClient, group_name: str) -> Group:
-    """Look up a group and raise if it does not exist."""
+    """Look up a group and raise if it does not exist.
+
+    The group's ID is remembered on disk for ``_GROUP_CACHE_TTL`` seconds
+    per workspace, so commands run back to back (e.g. ``add-users`` then
+    ``list-users``) skip the SCIM lookup.  Membership is never cached;
+    callers always read it fresh.
+    """
+    key = f"{client.config.host}|{group_name}"
+    group_id = _cached_group_id(key)
+    if group_id is not None:
+        return Group(id=group_id, display_name=group_name)
+
     group = find_group(client, group_name)
     if group is None or group.id is None:
         raise RuntimeError(
@@ -42,11 +98,13 @@ def require_group(client: WorkspaceClient, group_name: str) -> Group:
             "Create it at https://accounts.cloud.databricks.com > "
             "User management > Groups, then add it to the workspace."
         )
+    _remember_group_id(key, group.id)
     return group
 
 
+@functools.cache
 def get_account_client() -> AccountClient:
-    """Create an AccountClient for account-level group management.
+    """Return the AccountClient for account-level group management, created once.
 
     Requires ``DATABRICKS_ACCOUNT_ID`` in the environment.
     """
@@ -64,7 +122,7 @@ def get_group_member_ids(acct: AccountClient, group_id: str) -> set[str]:
     group = acct.groups.get(id=group_id)
     if not group.members:
         return set()
-    return {m.value for m in group.members if m.value}
+    return set(filter(None, map(attrgetter("value"), group.members)))
 
 
 def add_members_to_group(
@@ -94,15 +152,21 @@ def remove_members_from_group(
     group_id: str,
     user_ids: list[str],
 ) -> None:
-    """Remove users from an account-level group one at a time."""
-    for uid in user_ids:
+    """Remove users from an account-level group in batches.
+
+    Each PATCH carries one REMOVE operation per user in the batch.
+    """
+    for i in range(0, len(user_ids), _BATCH_SIZE):
+        batch = user_ids[i : i + _BATCH_SIZE]
         acct.groups.patch(
             id=group_id,
             operations=[
                 Patch(
                     op=PatchOp.REMOVE,
                     path=f'members[value eq "{uid}"]',
-                ),
+                )
+                for uid in batch
             ],
             schemas=[PatchSchema.URN_IETF_PARAMS_SCIM_API_MESSAGES_2_0_PATCH_OP],
         )
+        log(f"  Removed batch of {len(batch)} member(s) from group.")
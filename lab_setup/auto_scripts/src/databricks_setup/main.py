@@ -46,10 +46,12 @@ from .log import Level, close_log_file, init_log_file, log, log_context, log_to_
 from .notebooks import upload_notebooks, verify_notebook_upload
 from .permissions import run_permissions_lockdown
 from .users import (
+    USER_ATTRIBUTES,
     cluster_name_for_user,
     create_workspace_user,
     email_prefix,
-    find_workspace_user,
+    find_workspace_users,
+    list_workspace_users,
     parse_csv,
     preview_csv,
 )
@@ -448,13 +450,18 @@ def _ensure_workspace_users(
 
     grp = require_group(client, WORKSHOP_GROUP)
     group_id: str = grp.id  # type: ignore[assignment]
-    existing_members = get_group_member_ids(acct, group_id)  # type: ignore[arg-type]
+    # The member list (account SCIM) and the user lookup (workspace SCIM)
+    # are independent, so fetch the members in the background.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        members_future = pool.submit(get_group_member_ids, acct, group_id)  # type: ignore[arg-type]
+        users_by_email = find_workspace_users(client, emails)
+        existing_members = members_future.result()
 
     to_add_to_group: list[str] = []
     user_emails_ok: list[str] = []
 
     for email in emails:
-        user = find_workspace_user(client, email)
+        user = users_by_email.get(email)
         if user is not None and user.id is not None:
             log(f"  {email} — exists")
             stats.users_existed += 1
@@ -633,7 +640,10 @@ def _run_remove_users(*, keep_clusters: bool) -> None:
 
     grp = require_group(client, WORKSHOP_GROUP)
     group_id: str = grp.id  # type: ignore[assignment]
-    existing_members = get_group_member_ids(acct, group_id)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        members_future = pool.submit(get_group_member_ids, acct, group_id)
+        users_by_email = find_workspace_users(client, emails)
+        existing_members = members_future.result()
 
     removed = 0
     not_found = 0
@@ -641,7 +651,7 @@ def _run_remove_users(*, keep_clusters: bool) -> None:
     to_remove: list[str] = []
 
     for email in emails:
-        user = find_workspace_user(client, email)
+        user = users_by_email.get(email)
         if user is None or user.id is None:
             log(f"  [yellow]Not found in workspace: {email}[/yellow]")
             not_found += 1
@@ -694,6 +704,10 @@ def _run_remove_users(*, keep_clusters: bool) -> None:
 # list-users orchestration
 # ---------------------------------------------------------------------------
 
+# Concurrent SCIM lookups when listing group members.
+_LOOKUP_WORKERS = 16
+
+
 def _run_list_users() -> None:
     """List group members with email, display name, cluster name, cluster state."""
     config = Config.load()
@@ -713,16 +727,25 @@ def _run_list_users() -> None:
     user_clusters = find_user_clusters(client)
     cluster_map = {uc.cluster_name: uc for uc in user_clusters}
 
-    rows: list[tuple[str, str, str, str]] = []
-    for uid in member_ids:
+    # Members are resolved from one workspace user listing; only those not
+    # in it (e.g. account users without workspace access) cost a GET each.
+    users_by_id = list_workspace_users(client)
+
+    def _fetch_member(uid: str) -> tuple[str, str]:
         try:
-            user = client.users.get(id=uid)
-            email = user.user_name or "(no email)"
-            display = user.display_name or ""
+            user = users_by_id.get(uid) or client.users.get(
+                id=uid, attributes=USER_ATTRIBUTES
+            )
+            return user.user_name or "(no email)", user.display_name or ""
         except Exception:
-            email = f"(id={uid})"
-            display = "(could not fetch)"
+            return f"(id={uid})", "(could not fetch)"
+
+    # The fallback GETs are independent, so overlap their round trips.
+    with ThreadPoolExecutor(max_workers=_LOOKUP_WORKERS) as pool:
+        members = list(pool.map(_fetch_member, member_ids))
 
+    rows: list[tuple[str, str, str, str]] = []
+    for email, display in members:
         cname = cluster_name_for_user(email) if "@" in email else ""
         uc = cluster_map.get(cname)
         cstate = str(uc.state.value) if uc else "(none)"
@@ -6,6 +6,7 @@ import csv
 from pathlib import Path
 
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.errors.base import DatabricksError
 from databricks.sdk.service.iam import User
 
 from .log import log
@@ -25,18 +26,22 @@ def parse_csv(path: Path) -> list[str]:
         raise RuntimeError(f"CSV file not found: {path}")
 
     with open(path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        if reader.fieldnames is None or "email" not in [
-            n.strip().lower() for n in reader.fieldnames
-        ]:
+        # Only one column is read, so rows stay lists instead of a dict each.
+        reader = csv.reader(f)
+        header = next(reader, None)
+        # Find the email column (case-insensitive)
+        email_col = next(
+            (i for i, name in enumerate(header or []) if name.strip().lower() == "email"),
+            None,
+        )
+        if email_col is None:
             raise RuntimeError("CSV file must have an 'email' column header.")
 
-        # Find the actual column name (case-insensitive)
-        email_col = next(n for n in reader.fieldnames if n.strip().lower() == "email")
-
         seen: set[str] = set()
         emails: list[str] = []
         for row in reader:
+            if len(row) <= email_col:
+                continue
             email = row[email_col].strip().lower()
             if email and email not in seen:
                 seen.add(email)
@@ -60,12 +65,66 @@ def preview_csv(path: Path, max_rows: int = 2) -> list[dict[str, str]]:
     return rows
 
 
+# The only user fields this package reads; requesting just these keeps
+# SCIM responses free of groups, roles and entitlements.
+USER_ATTRIBUTES = "id,userName,displayName"
+
+
 def find_workspace_user(client: WorkspaceClient, email: str) -> User | None:
-    """Look up a workspace user by email address."""
-    results = list(client.users.list(filter=f'userName eq "{email}"'))
-    if results:
-        return results[0]
-    return None
+    """Look up a workspace user by email address.
+
+    This is the per-email fallback used by :func:`find_workspace_users`. It
+    asks for a single-record page and takes the first match without
+    draining the paginator.
+    """
+    users = client.users.list(
+        filter=f'userName eq "{email}"', attributes=USER_ATTRIBUTES, count=1
+    )
+    return next(iter(users), None)
+
+
+# Emails OR-ed into one SCIM filter by find_workspace_users.
+_FILTER_BATCH_SIZE = 50
+
+
+def find_workspace_users(client: WorkspaceClient, emails: list[str]) -> dict[str, User]:
+    """Look up many workspace users by email, keyed by lowercased email.
+
+    Emails are OR-ed into one ``userName eq`` filter per batch, so resolving
+    a users file costs one request per batch however large the workspace
+    is.  If the server rejects a batch's filter, that batch falls back to
+    one :func:`find_workspace_user` call per email.  Emails with no
+    workspace user are absent from the result.
+    """
+    found: dict[str, User] = {}
+    for i in range(0, len(emails), _FILTER_BATCH_SIZE):
+        batch = emails[i : i + _FILTER_BATCH_SIZE]
+        query = " or ".join(f'userName eq "{email}"' for email in batch)
+        try:
+            for user in client.users.list(filter=query, attributes=USER_ATTRIBUTES):
+                if user.user_name:
+                    found[user.user_name.lower()] = user
+        except DatabricksError as exc:
+            log(f"  [yellow]Batched user lookup failed ({exc}); "
+                f"looking up {len(batch)} user(s) one at a time.[/yellow]")
+            for email in batch:
+                single = find_workspace_user(client, email)
+                if single is not None:
+                    found[email.lower()] = single
+    return found
+
+
+def list_workspace_users(client: WorkspaceClient) -> dict[str, User]:
+    """Return every workspace user keyed by ID.
+
+    One paginated listing replaces a SCIM round trip per user when
+    resolving a group's members.
+    """
+    return {
+        user.id: user
+        for user in client.users.list(attributes=USER_ATTRIBUTES)
+        if user.id
+    }
 
 
 def create_workspace_user(client: WorkspaceClient, email: str) -> User:
@@ -1,5 +1,6 @@
 """Utility functions and helpers for Databricks setup."""
 
+import functools
 import time
 from collections.abc import Callable
 from typing import TypeVar
@@ -11,8 +12,13 @@ from .log import log
 T = TypeVar("T")
 
 
+@functools.cache
 def get_workspace_client(profile: str | None = None) -> WorkspaceClient:
-    """Create a Databricks WorkspaceClient with optional profile."""
+    """Return the Databricks WorkspaceClient for *profile*, created once.
+
+    Cached so every caller in the process shares one client and its
+    authenticated HTTP connection pool.
+    """
     if profile:
         return WorkspaceClient(profile=profile)
     return WorkspaceClient()
@@ -0,0 +1,71 @@
+"""Tests for the on-disk group-ID cache used by ``require_group``."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from databricks.sdk.service.iam import Group
+
+from databricks_setup import groups
+
+HOST = "https://example.cloud.databricks.com"
+KEY = f"{HOST}|{groups.WORKSHOP_GROUP}"
+
+
+def _client(group_id: str = "api-id") -> mock.Mock:
+    client = mock.Mock()
+    client.config.host = HOST
+    client.groups.list.return_value = [
+        Group(id=group_id, display_name=groups.WORKSHOP_GROUP)
+    ]
+    return client
+
+
+class RequireGroupCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = Path(tmp.name) / "groups.json"
+        patcher = mock.patch.object(groups, "_GROUP_CACHE", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_fresh_entry_skips_lookup(self) -> None:
+        self.cache.write_text(json.dumps({KEY: {"id": "cached-id", "at": time.time()}}))
+        client = _client()
+
+        group = groups.require_group(client, groups.WORKSHOP_GROUP)
+
+        self.assertEqual(group.id, "cached-id")
+        client.groups.list.assert_not_called()
+
+    def test_corrupt_cache_falls_back_to_api(self) -> None:
+        for content in ("[]", "null", "not json", json.dumps({KEY: "oops"})):
+            with self.subTest(content=content):
+                self.cache.write_text(content)
+                client = _client()
+
+                group = groups.require_group(client, groups.WORKSHOP_GROUP)
+
+                self.assertEqual(group.id, "api-id")
+                client.groups.list.assert_called_once()
+
+    def test_stale_entry_falls_back_to_api(self) -> None:
+        stale = time.time() - groups._GROUP_CACHE_TTL - 1
+        self.cache.write_text(json.dumps({KEY: {"id": "old-id", "at": stale}}))
+        client = _client()
+
+        group = groups.require_group(client, groups.WORKSHOP_GROUP)
+
+        self.assertEqual(group.id, "api-id")
+        client.groups.list.assert_called_once()
+        self.assertEqual(json.loads(self.cache.read_text())[KEY]["id"], "api-id")
+
+
+if __name__ == "__main__":
+    unittest.main()
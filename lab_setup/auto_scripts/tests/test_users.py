@@ -0,0 +1,73 @@
+"""Tests for workspace user lookups."""
+
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from databricks.sdk.errors.base import DatabricksError
+from databricks.sdk.service.iam import User
+
+from databricks_setup import users
+
+
+def _user(user_id: str, user_name: str) -> User:
+    return User(id=user_id, user_name=user_name)
+
+
+class FindWorkspaceUserTest(unittest.TestCase):
+    def test_requests_a_single_record_page(self) -> None:
+        client = mock.Mock()
+        client.users.list.return_value = iter([_user("1", "ada@example.com")])
+
+        user = users.find_workspace_user(client, "ada@example.com")
+
+        self.assertIsNotNone(user)
+        client.users.list.assert_called_once_with(
+            filter='userName eq "ada@example.com"',
+            attributes=users.USER_ATTRIBUTES,
+            count=1,
+        )
+
+
+class FindWorkspaceUsersTest(unittest.TestCase):
+    def test_batch_hits_need_no_fallback(self) -> None:
+        client = mock.Mock()
+        client.users.list.return_value = [
+            _user("1", "Ada@Example.com"),
+            _user("2", "bob@example.com"),
+        ]
+
+        found = users.find_workspace_users(client, ["ada@example.com", "bob@example.com"])
+
+        self.assertEqual({k: u.id for k, u in found.items()},
+                         {"ada@example.com": "1", "bob@example.com": "2"})
+        client.users.list.assert_called_once()
+
+    def test_unmatched_email_is_absent_without_extra_calls(self) -> None:
+        client = mock.Mock()
+        # New users are simply missing from the batch response.
+        client.users.list.return_value = [_user("1", "ada@example.com")]
+
+        found = users.find_workspace_users(client, ["ada@example.com", "new@example.com"])
+
+        self.assertEqual({k: u.id for k, u in found.items()}, {"ada@example.com": "1"})
+        client.users.list.assert_called_once()
+
+    def test_failed_batch_falls_back_to_single_lookups(self) -> None:
+        client = mock.Mock()
+        client.users.list.side_effect = [
+            DatabricksError("filter too long"),
+            iter([_user("3", "Carol@Example.com")]),
+            iter([]),
+        ]
+
+        found = users.find_workspace_users(client, ["carol@example.com", "dave@example.com"])
+
+        self.assertEqual({k: u.id for k, u in found.items()}, {"carol@example.com": "3"})
+        retried = [c.kwargs["filter"] for c in client.users.list.call_args_list[1:]]
+        self.assertEqual(retried, ['userName eq "carol@example.com"',
+                                   'userName eq "dave@example.com"'])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -32,6 +32,8 @@ class Settings(BaseSettings):
     openai_api_key: Optional[SecretStr] = None
     openai_embedding_model: str = "text-embedding-3-small"
     openai_embedding_dimensions: int = 1536
+    # Reuse embeddings from earlier runs (~/.cache/populate_aircraft_db).
+    embedding_cache: bool = True
 
     # OpenAI chat model — used by the `enrich` command for entity extraction.
     openai_extraction_model: str = "gpt-4o-mini"
@@ -43,6 +45,9 @@ class Settings(BaseSettings):
     anthropic_api_key: Optional[SecretStr] = None
     anthropic_extraction_model: str = "claude-sonnet-4-5-20250929"
 
+    # Max concurrent LLM extraction calls during `enrich`.
+    llm_concurrency: int = 10
+
     # Chunking settings for the `enrich` command.
     chunk_size: int = 800
     chunk_overlap: int = 100
@@ -0,0 +1,60 @@
+"""Persistent on-disk cache of chunk embeddings, keyed by text hash."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+
+CACHE_DIR = Path.home() / ".cache" / "populate_aircraft_db"
+
+# Stay well under SQLite's bound-parameter limit in IN (...) lookups.
+_LOOKUP_BATCH = 500
+
+
+def _key(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """SQLite map of ``sha256(text)`` to a float32 vector for one model/dimensions pair.
+
+    One file per (model, dimensions) keeps vectors from different embedding
+    configurations apart.  Safe to share across threads.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def for_model(cls, model: str, dimensions: int) -> EmbeddingCache:
+        return cls(CACHE_DIR / f"emb-{model}-{dimensions}.sqlite")
+
+    def get_many(self, texts: list[str]) -> dict[str, list[float]]:
+        """Return cached vectors for whichever of *texts* are present."""
+        by_key = {_key(t): t for t in texts}
+        keys = list(by_key)
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for i in range(0, len(keys), _LOOKUP_BATCH):
+                batch = keys[i : i + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", batch
+                )
+                for key, blob in rows:
+                    found[by_key[key]] = array("f", blob).tolist()
+        return found
+
+    def put_many(self, vectors: dict[str, list[float]]) -> None:
+        rows = [(_key(t), array("f", v).tobytes()) for t, v in vectors.items()]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO embeddings VALUES (?, ?)", rows)
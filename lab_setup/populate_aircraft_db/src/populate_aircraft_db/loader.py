@@ -6,7 +6,7 @@ import csv
 from pathlib import Path
 from typing import Any
 
-from neo4j import Driver
+from neo4j import WRITE_ACCESS, Driver
 
 BATCH_SIZE = 1000
 
@@ -307,47 +307,47 @@ def load_relationships(driver: Driver, data_dir: Path) -> None:
 
 
 def clear_database(driver: Driver) -> None:
-    """Delete all nodes and relationships in batches."""
+    """Delete all nodes and relationships in server-side batches."""
     print("Clearing database...")
-    deleted_total = 0
-    while True:
-        records, _, _ = driver.execute_query(
-            "MATCH (n) WITH n LIMIT 500 DETACH DELETE n RETURN count(*) AS deleted"
-        )
-        count = records[0]["deleted"]
-        deleted_total += count
-        if count > 0:
-            print(f"  Deleted {deleted_total} nodes so far...", end="\r")
-        if count == 0:
-            break
-    print(f"\n  [OK] Database cleared ({deleted_total} nodes deleted).")
+    # CALL ... IN TRANSACTIONS needs an auto-commit transaction, hence
+    # session.run rather than execute_query.
+    with driver.session(default_access_mode=WRITE_ACCESS) as session:
+        summary = session.run(
+            "MATCH (n) CALL (n) { DETACH DELETE n } IN TRANSACTIONS OF 1000 ROWS"
+        ).consume()
+    print(f"  [OK] Database cleared ({summary.counters.nodes_deleted} nodes deleted).")
+
+
+_NODE_COUNTS_Q = """
+CALL () {
+    MATCH (n:Aircraft) RETURN 'Aircraft' as label, count(n) as count
+    UNION ALL
+    MATCH (n:System) RETURN 'System' as label, count(n) as count
+    UNION ALL
+    MATCH (n:Component) RETURN 'Component' as label, count(n) as count
+    UNION ALL
+    MATCH (n:Sensor) RETURN 'Sensor' as label, count(n) as count
+    UNION ALL
+    MATCH (n:Airport) RETURN 'Airport' as label, count(n) as count
+    UNION ALL
+    MATCH (n:Flight) RETURN 'Flight' as label, count(n) as count
+    UNION ALL
+    MATCH (n:Delay) RETURN 'Delay' as label, count(n) as count
+    UNION ALL
+    MATCH (n:MaintenanceEvent) RETURN 'MaintenanceEvent' as label, count(n) as count
+    UNION ALL
+    MATCH (n:Removal) RETURN 'Removal' as label, count(n) as count
+}
+RETURN label, count
+ORDER BY count DESC
+"""
+
+_REL_COUNT_Q = "MATCH ()-[r]->() RETURN count(r) as count"
 
 
 def verify(driver: Driver) -> None:
     """Print node counts per label and total relationship count."""
-    node_counts, _, _ = driver.execute_query("""
-        CALL () {
-            MATCH (n:Aircraft) RETURN 'Aircraft' as label, count(n) as count
-            UNION ALL
-            MATCH (n:System) RETURN 'System' as label, count(n) as count
-            UNION ALL
-            MATCH (n:Component) RETURN 'Component' as label, count(n) as count
-            UNION ALL
-            MATCH (n:Sensor) RETURN 'Sensor' as label, count(n) as count
-            UNION ALL
-            MATCH (n:Airport) RETURN 'Airport' as label, count(n) as count
-            UNION ALL
-            MATCH (n:Flight) RETURN 'Flight' as label, count(n) as count
-            UNION ALL
-            MATCH (n:Delay) RETURN 'Delay' as label, count(n) as count
-            UNION ALL
-            MATCH (n:MaintenanceEvent) RETURN 'MaintenanceEvent' as label, count(n) as count
-            UNION ALL
-            MATCH (n:Removal) RETURN 'Removal' as label, count(n) as count
-        }
-        RETURN label, count
-        ORDER BY count DESC
-    """)
+    node_counts, _, _ = driver.execute_query(_NODE_COUNTS_Q)
 
     print()
     print("=" * 50)
@@ -359,9 +359,7 @@ def verify(driver: Driver) -> None:
     print(f"  ---------------------")
     print(f"  Total Nodes: {total_nodes:,}")
 
-    rel_records, _, _ = driver.execute_query(
-        "MATCH ()-[r]->() RETURN count(r) as count"
-    )
+    rel_records, _, _ = driver.execute_query(_REL_COUNT_Q)
     rel_count = rel_records[0]["count"]
     print(f"\nTotal Relationships: {rel_count:,}")
     print("=" * 50)
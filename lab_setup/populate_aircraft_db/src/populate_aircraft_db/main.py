@@ -15,10 +15,10 @@ from neo4j.exceptions import ServiceUnavailable
 from .config import Settings
 from .loader import clear_database, load_nodes, load_relationships, verify
 from .schema import (
-    create_constraints,
     create_embedding_indexes,
     create_extraction_constraints,
-    create_indexes,
+    create_link_indexes,
+    create_schema,
 )
 
 app = typer.Typer(
@@ -41,6 +41,10 @@ def _connect(settings: Settings) -> Generator[Driver, None, None]:
     driver = GraphDatabase.driver(
         settings.neo4j_uri,
         auth=(settings.neo4j_username, settings.neo4j_password.get_secret_value()),
+        # enrich runs documents concurrently; leave headroom for their writes.
+        max_connection_pool_size=50,
+        connection_acquisition_timeout=60,
+        max_connection_lifetime=1200,
     )
     try:
         driver.verify_connectivity()
@@ -65,10 +69,8 @@ def load() -> None:
 
     print(f"Connecting to {settings.neo4j_uri}...")
     with _connect(settings) as driver:
-        print("Creating constraints...")
-        create_constraints(driver)
-        print("\nCreating indexes...")
-        create_indexes(driver)
+        print("Creating constraints and indexes...")
+        create_schema(driver)
         print()
 
         load_nodes(driver, settings.data_dir)
@@ -160,8 +162,7 @@ def enrich_cmd() -> None:
     print(f"Connecting to {settings.neo4j_uri}...")
     with _connect(settings) as driver:
         print("Creating constraints and indexes...")
-        create_constraints(driver)
-        create_indexes(driver)
+        create_schema(driver)
         # NOTE: extraction constraints are created AFTER the pipeline runs.
         # SimpleKGPipeline uses CREATE (not MERGE), so pre-existing uniqueness
         # constraints on entity labels cause batch write failures when the same
@@ -188,6 +189,8 @@ def enrich_cmd() -> None:
             embedding_dimensions=settings.openai_embedding_dimensions,
             chunk_size=settings.chunk_size,
             chunk_overlap=settings.chunk_overlap,
+            llm_concurrency=settings.llm_concurrency,
+            embedding_cache=settings.embedding_cache,
             enrich_sample_size=settings.enrich_sample_size,
         )
 
@@ -197,6 +200,9 @@ def enrich_cmd() -> None:
         print("\nCreating embedding indexes...")
         create_embedding_indexes(driver, settings.openai_embedding_dimensions)
 
+        print("\nCreating link indexes...")
+        create_link_indexes(driver)
+
         print("\nLinking to existing graph...")
         link_to_existing_graph(driver)
 
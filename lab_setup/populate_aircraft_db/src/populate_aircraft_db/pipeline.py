@@ -3,15 +3,30 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import json
+import mmap
+import random
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
 
-from neo4j import Driver
+import openai
+from neo4j import WRITE_ACCESS, Driver
+from neo4j_graphrag.embeddings.base import Embedder
 from neo4j_graphrag.embeddings.openai import OpenAIEmbeddings
-
-# Labels for extracted entity nodes (used by clear/verify logic).
-EXTRACTED_LABELS = ["OperatingLimit"]
+from neo4j_graphrag.experimental.components.text_splitters.fixed_size_splitter import (
+    FixedSizeSplitter,
+)
+from neo4j_graphrag.experimental.pipeline.kg_builder import SimpleKGPipeline
+
+from .embedding_cache import EmbeddingCache
+from .schema import (
+    EXTRACTED_LABELS,
+    build_extraction_response_format,
+    build_extraction_schema,
+)
 
 # ---------------------------------------------------------------------------
 # Document metadata registry
@@ -48,24 +63,180 @@ DOCUMENTS: list[DocumentMeta] = [
 ]
 
 
+# Retries per API request (429, 5xx, timeouts, connection errors).  The OpenAI
+# and Anthropic SDKs back off exponentially with jitter and honor Retry-After,
+# so one transient failure costs a single chunk's call instead of failing the
+# whole manual.
+_API_MAX_RETRIES = 5
+
+
 # ---------------------------------------------------------------------------
-# Dimension-aware embedder wrapper
+# Embedder
 # ---------------------------------------------------------------------------
 
 
-class DimensionAwareOpenAIEmbeddings(OpenAIEmbeddings):
-    """OpenAIEmbeddings that always passes ``dimensions`` to the API.
+def _create_embedder(model: str, dimensions: int, api_key: str | None) -> OpenAIEmbeddings:
+    """Build an ``OpenAIEmbeddings`` whose ``embed_query`` always passes ``dimensions``.
 
     The pipeline's ``TextChunkEmbedder`` calls ``embed_query(text)`` without
-    a ``dimensions`` kwarg, so we override to inject it automatically.
+    a ``dimensions`` kwarg, so it is bound onto the instance up front.
+    """
+    embedder = OpenAIEmbeddings(model=model, api_key=api_key, max_retries=_API_MAX_RETRIES)
+    embedder.embed_query = functools.partial(embedder.embed_query, dimensions=dimensions)  # type: ignore[method-assign]
+    return embedder
+
+
+# Inputs per embeddings request (the API accepts up to 2048).
+_EMBED_BATCH_SIZE = 512
+
+# Vectors kept in memory for the run.  Far more than one manual's chunks, so
+# a prefetched vector is still there when the pipeline asks for it, while
+# bounding memory if many large manuals are enriched in one go.
+_MAX_MEMORY_VECTORS = 10_000
+
+
+class BatchedEmbeddings(Embedder):
+    """Serves ``embed_query`` from vectors fetched in batched API requests.
+
+    ``TextChunkEmbedder`` embeds one chunk per ``embed_query`` call.  The
+    splitter hook below passes every chunk of a document to :meth:`prefetch`
+    first, so those calls become dict lookups instead of one request each.
+    With a *cache*, texts embedded by an earlier run skip the API entirely.
+
+    Batches go through *async_client* so prefetching never blocks the event
+    loop that the other documents' pipelines share.
     """
 
-    def __init__(self, dimensions: int, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
+    def __init__(
+        self,
+        embedder: OpenAIEmbeddings,
+        dimensions: int,
+        async_client: openai.AsyncOpenAI,
+        cache: EmbeddingCache | None = None,
+    ) -> None:
+        super().__init__()
+        self._embedder = embedder
         self._dimensions = dimensions
+        self._async_client = async_client
+        self._cache = cache
+        self._vectors: OrderedDict[str, list[float]] = OrderedDict()
 
-    def embed_query(self, text: str, **kwargs: Any) -> list[float]:
-        return super().embed_query(text, dimensions=self._dimensions, **kwargs)
+    async def _aembed_batch(self, batch: list[str]) -> list[list[float]]:
+        response = await self._async_client.embeddings.create(
+            input=batch, model=self._embedder.model, dimensions=self._dimensions
+        )
+        return [item.embedding for item in response.data]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed *texts* in batches sent concurrently; results keep input order.
+
+        Texts are batched shortest first so each request holds similar-length
+        inputs and no batch waits on a few long stragglers.
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        by_length = [texts[i] for i in order]
+        batches = [
+            by_length[i : i + _EMBED_BATCH_SIZE] for i in range(0, len(by_length), _EMBED_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(self._aembed_batch(b) for b in batches))
+        vectors: list[list[float]] = [[]] * len(texts)
+        for i, vector in zip(order, (v for batch in results for v in batch), strict=True):
+            vectors[i] = vector
+        return vectors
+
+    def _remember(self, vectors: dict[str, list[float]]) -> None:
+        self._vectors.update(vectors)
+        while len(self._vectors) > _MAX_MEMORY_VECTORS:
+            self._vectors.popitem(last=False)
+
+    async def prefetch(self, texts: list[str]) -> None:
+        missing = [t for t in dict.fromkeys(texts) if t not in self._vectors]
+        if missing and self._cache is not None:
+            cached = self._cache.get_many(missing)
+            self._remember(cached)
+            missing = [t for t in missing if t not in cached]
+        if missing:
+            fetched = dict(zip(missing, await self.aembed_documents(missing), strict=True))
+            self._remember(fetched)
+            if self._cache is not None:
+                self._cache.put_many(fetched)
+
+    async def aclose(self) -> None:
+        """Close the async client's connection pool on the loop that used it."""
+        await self._async_client.close()
+
+    def embed_query(self, text: str, **kwargs) -> list[float]:
+        vector = self._vectors.get(text)
+        if vector is not None:
+            self._vectors.move_to_end(text)
+            return vector
+        vector = self._embedder.embed_query(text, **kwargs)
+        self._remember({text: vector})
+        if self._cache is not None:
+            self._cache.put_many({text: vector})
+        return vector
+
+
+def _prefetch_embeddings(splitter, embedder: BatchedEmbeddings):
+    """Batch-embed each document's chunks as soon as *splitter* produces them."""
+    run = splitter.run
+
+    async def _run_and_prefetch(*args, **kwargs):
+        chunks = await run(*args, **kwargs)
+        await embedder.prefetch([c.text for c in chunks.chunks])
+        return chunks
+
+    splitter.run = _run_and_prefetch
+    return splitter
+
+
+# ---------------------------------------------------------------------------
+# LLM concurrency limit
+# ---------------------------------------------------------------------------
+
+
+def _limit_concurrency(llm, max_concurrency: int):
+    """Cap in-flight ``ainvoke`` calls on *llm* with a semaphore.
+
+    Extraction fans out over chunks; bounding it keeps us under provider rate
+    limits.  A little jitter staggers calls released at the same moment.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    ainvoke = llm.ainvoke
+
+    async def _bounded_ainvoke(*args, **kwargs):
+        async with semaphore:
+            await asyncio.sleep(random.uniform(0, 0.05))
+            return await ainvoke(*args, **kwargs)
+
+    llm.ainvoke = _bounded_ainvoke
+    return llm
+
+
+def _drop_null_properties(llm):
+    """Strip ``null`` node properties from *llm*'s extraction replies.
+
+    The strict response format makes every property required, so the model
+    answers ``null`` for anything a chunk does not mention.  The extractor's
+    graph validation rejects ``None`` values, and with ``on_error="IGNORE"``
+    that would discard every entity in the chunk.
+    """
+    ainvoke = llm.ainvoke
+
+    async def _cleaned_ainvoke(*args, **kwargs):
+        response = await ainvoke(*args, **kwargs)
+        try:
+            graph = json.loads(response.content)
+        except (TypeError, ValueError):
+            return response
+        for node in graph.get("nodes", []):
+            props = node.get("properties")
+            if isinstance(props, dict):
+                node["properties"] = {k: v for k, v in props.items() if v is not None}
+        return response.model_copy(update={"content": json.dumps(graph)})
+
+    llm.ainvoke = _cleaned_ainvoke
+    return llm
 
 
 # ---------------------------------------------------------------------------
@@ -84,15 +255,14 @@ def _create_pipeline(
     embedding_dimensions: int,
     chunk_size: int,
     chunk_overlap: int,
-):
-    """Build a ``SimpleKGPipeline`` configured for maintenance-manual enrichment."""
-    from neo4j_graphrag.experimental.pipeline.kg_builder import SimpleKGPipeline
-    from neo4j_graphrag.experimental.components.text_splitters.fixed_size_splitter import (
-        FixedSizeSplitter,
-    )
-
-    from .schema import build_extraction_schema
+    llm_concurrency: int,
+    embedding_cache: bool,
+) -> tuple[SimpleKGPipeline, BatchedEmbeddings]:
+    """Build a ``SimpleKGPipeline`` configured for maintenance-manual enrichment.
 
+    The embedder is returned alongside so the caller can close its shared
+    async client once every document has been processed.
+    """
     # --- LLM ---
     if provider == "openai":
         from neo4j_graphrag.llm.openai_llm import OpenAILLM
@@ -102,10 +272,12 @@ def _create_pipeline(
             model_params={
                 "max_tokens": 2000,
                 "temperature": 0,
-                "response_format": {"type": "json_object"},
+                "response_format": build_extraction_response_format(),
             },
             api_key=openai_api_key,
+            max_retries=_API_MAX_RETRIES,
         )
+        llm = _drop_null_properties(llm)
     elif provider == "anthropic":
         from neo4j_graphrag.llm.anthropic_llm import AnthropicLLM
 
@@ -113,15 +285,20 @@ def _create_pipeline(
             model_name=llm_model,
             model_params={"max_tokens": 4096},
             api_key=anthropic_api_key,
+            max_retries=_API_MAX_RETRIES,
         )
     else:
         raise ValueError(f"Unknown LLM provider: {provider!r}")
+    llm = _limit_concurrency(llm, llm_concurrency)
 
     # --- Embedder ---
-    embedder = DimensionAwareOpenAIEmbeddings(
-        dimensions=embedding_dimensions,
-        model=embedding_model,
-        api_key=openai_api_key,
+    embedder = BatchedEmbeddings(
+        _create_embedder(embedding_model, embedding_dimensions, openai_api_key),
+        embedding_dimensions,
+        openai.AsyncOpenAI(api_key=openai_api_key, max_retries=_API_MAX_RETRIES),
+        cache=EmbeddingCache.for_model(embedding_model, embedding_dimensions)
+        if embedding_cache
+        else None,
     )
 
     # --- Text splitter ---
@@ -130,11 +307,12 @@ def _create_pipeline(
         chunk_overlap=chunk_overlap,
         approximate=True,
     )
+    splitter = _prefetch_embeddings(splitter, embedder)
 
     # --- Schema ---
     schema = build_extraction_schema()
 
-    return SimpleKGPipeline(
+    pipeline = SimpleKGPipeline(
         llm=llm,
         driver=driver,
         embedder=embedder,
@@ -144,6 +322,7 @@ def _create_pipeline(
         on_error="IGNORE",
         perform_entity_resolution=True,
     )
+    return pipeline, embedder
 
 
 # ---------------------------------------------------------------------------
@@ -151,6 +330,32 @@ def _create_pipeline(
 # ---------------------------------------------------------------------------
 
 
+def _read_manual(path: Path, max_chars: int) -> tuple[str, bool]:
+    """Return the stripped text of *path* and whether it was truncated.
+
+    When *max_chars* > 0 only the leading bytes that can hold that many
+    characters (UTF-8 is at most 4 bytes each) are decoded, through an mmap,
+    so a sample run never buffers the whole manual.
+    """
+    if not max_chars or path.stat().st_size == 0:
+        return path.read_text(encoding="utf-8").strip(), False
+
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        head = mm[: max_chars * 4]
+        complete = len(head) == len(mm)
+
+    # errors="ignore" only drops a multi-byte character split by the slice.
+    text = head.decode("utf-8", errors="ignore").lstrip()
+    if len(text) > max_chars:
+        return text[:max_chars], True
+    return (text.rstrip() if complete else text), not complete
+
+
+# Manuals run through the pipeline at the same time.  Their LLM calls share
+# the LLM_CONCURRENCY cap, so more slots than this mainly cost memory.
+_MAX_CONCURRENT_DOCUMENTS = 3
+
+
 def process_all_documents(
     driver: Driver,
     data_dir: Path,
@@ -163,6 +368,8 @@ def process_all_documents(
     embedding_dimensions: int,
     chunk_size: int,
     chunk_overlap: int,
+    llm_concurrency: int,
+    embedding_cache: bool,
     enrich_sample_size: int = 0,
 ) -> None:
     """Run the SimpleKGPipeline over every maintenance manual.
@@ -171,7 +378,7 @@ def process_all_documents(
     so that approximately that many chunks are produced.  Useful for quick test
     runs without processing the full manuals.
     """
-    pipeline = _create_pipeline(
+    pipeline, embedder = _create_pipeline(
         driver,
         provider=provider,
         openai_api_key=openai_api_key,
@@ -181,6 +388,8 @@ def process_all_documents(
         embedding_dimensions=embedding_dimensions,
         chunk_size=chunk_size,
         chunk_overlap=chunk_overlap,
+        llm_concurrency=llm_concurrency,
+        embedding_cache=embedding_cache,
     )
 
     # Pre-compute max text length when sample size is set.
@@ -190,16 +399,19 @@ def process_all_documents(
     else:
         max_chars = 0  # 0 = unlimited
 
-    async def _run_all():
-        for meta in DOCUMENTS:
-            print(f"\nProcessing: {meta.filename}")
-            filepath = data_dir / meta.filename
-            text = filepath.read_text(encoding="utf-8").strip()
-            print(f"  Read {len(text):,} characters.")
+    # A manual is only read once it holds a slot, so at most this many texts
+    # (and their chunks) are in memory however long DOCUMENTS grows.
+    slots = asyncio.Semaphore(_MAX_CONCURRENT_DOCUMENTS)
 
-            if max_chars and len(text) > max_chars:
-                text = text[:max_chars]
-                print(f"  Truncated to {max_chars:,} chars (~{enrich_sample_size} chunks).")
+    async def _process(meta: DocumentMeta) -> None:
+        async with slots:
+            text, truncated = await asyncio.to_thread(
+                _read_manual, data_dir / meta.filename, max_chars
+            )
+            if truncated:
+                print(f"  {meta.filename}: read first {max_chars:,} chars (~{enrich_sample_size} chunks).")
+            else:
+                print(f"  {meta.filename}: read {len(text):,} characters.")
 
             await pipeline.run_async(
                 text=text,
@@ -210,7 +422,24 @@ def process_all_documents(
                     "type": "maintenance_manual",
                 },
             )
-            print(f"  [OK] Pipeline complete for {meta.document_id}")
+        print(f"  [OK] Pipeline complete for {meta.document_id}")
+
+    # Documents are independent, so their LLM and embedding round-trips
+    # overlap; the LLM concurrency cap still bounds the total in flight.
+    async def _run_all():
+        print(f"\nProcessing {len(DOCUMENTS)} documents concurrently...")
+        try:
+            results = await asyncio.gather(
+                *(_process(meta) for meta in DOCUMENTS), return_exceptions=True
+            )
+        finally:
+            await embedder.aclose()
+        errors = [r for r in results if isinstance(r, BaseException)]
+        for meta, result in zip(DOCUMENTS, results, strict=True):
+            if isinstance(result, BaseException):
+                print(f"  [FAIL] {meta.document_id}: {result}")
+        if errors:
+            raise errors[0]
 
     asyncio.run(_run_all())
 
@@ -220,26 +449,57 @@ def process_all_documents(
 # ---------------------------------------------------------------------------
 
 
+# Document -[:APPLIES_TO]-> Aircraft.  The document -> aircraft type map is
+# already known in DOCUMENTS, so it is sent as one batch and each Document is
+# sought by its unique documentId instead of scanning for aircraftType.
+_APPLIES_TO_Q = """\
+UNWIND $docs AS doc
+MATCH (d:Document {documentId: doc.document_id})
+MATCH (a:Aircraft {model: doc.aircraft_type})
+CALL (d, a) { MERGE (d)-[:APPLIES_TO]->(a) } IN TRANSACTIONS OF 1000 ROWS
+RETURN count(*) AS count"""
+
+# Sensor -[:HAS_LIMIT]-> OperatingLimit (match parameterName + aircraftType).
+# Both links MERGE in batches of 1000 so no single transaction holds the
+# locks for every matched pair.
+_HAS_LIMIT_Q = """\
+MATCH (a:Aircraft)-[:HAS_SYSTEM]->(sys:System)-[:HAS_SENSOR]->(s:Sensor)
+MATCH (ol:OperatingLimit {parameterName: s.type, aircraftType: a.model})
+CALL (s, ol) { MERGE (s)-[:HAS_LIMIT]->(ol) } IN TRANSACTIONS OF 1000 ROWS
+RETURN count(*) AS count"""
+
+
+def _run_link(driver: Driver, query: str, params: dict) -> int:
+    # CALL ... IN TRANSACTIONS needs an auto-commit transaction, hence
+    # session.run rather than execute_query.
+    with driver.session(default_access_mode=WRITE_ACCESS) as session:
+        return session.run(query, params).single()["count"]
+
+
 def link_to_existing_graph(driver: Driver) -> None:
     """Create relationships between enrichment data and the operational graph."""
+    links = [
+        (
+            "Document -[:APPLIES_TO]-> Aircraft",
+            _APPLIES_TO_Q,
+            {
+                "docs": [
+                    {"document_id": m.document_id, "aircraft_type": m.aircraft_type}
+                    for m in DOCUMENTS
+                ]
+            },
+        ),
+        ("Sensor -[:HAS_LIMIT]-> OperatingLimit", _HAS_LIMIT_Q, {}),
+    ]
 
-    # Document -[:APPLIES_TO]-> Aircraft (via document metadata aircraftType)
-    records, _, _ = driver.execute_query("""
-        MATCH (d:Document) WHERE d.aircraftType IS NOT NULL
-        MATCH (a:Aircraft {model: d.aircraftType})
-        MERGE (d)-[:APPLIES_TO]->(a)
-        RETURN count(*) AS count
-    """)
-    print(f"  [OK] {records[0]['count']} Document -[:APPLIES_TO]-> Aircraft")
-
-    # Sensor -[:HAS_LIMIT]-> OperatingLimit (match parameterName + aircraftType)
-    records, _, _ = driver.execute_query("""
-        MATCH (a:Aircraft)-[:HAS_SYSTEM]->(sys:System)-[:HAS_SENSOR]->(s:Sensor)
-        MATCH (ol:OperatingLimit {parameterName: s.type, aircraftType: a.model})
-        MERGE (s)-[:HAS_LIMIT]->(ol)
-        RETURN count(*) AS count
-    """)
-    print(f"  [OK] {records[0]['count']} Sensor -[:HAS_LIMIT]-> OperatingLimit")
+    # The links lock disjoint node pairs, so they run as concurrent
+    # transactions on separate pooled connections.
+    with ThreadPoolExecutor(max_workers=len(links)) as pool:
+        futures = [
+            pool.submit(_run_link, driver, query, params) for _, query, params in links
+        ]
+        for (name, _, _), future in zip(links, futures, strict=True):
+            print(f"  [OK] {future.result()} {name}")
 
 
 # ---------------------------------------------------------------------------
@@ -247,34 +507,26 @@ def link_to_existing_graph(driver: Driver) -> None:
 # ---------------------------------------------------------------------------
 
 
+# __Entity__ and __KGBuilder__ labeled nodes are left behind by the pipeline.
+_ENRICHMENT_LABELS = ["Document", "Chunk"] + EXTRACTED_LABELS + ["__Entity__", "__KGBuilder__"]
+
+# Labels are a parameter, so one cached plan serves every run; the server
+# batches the deletes itself.  The dynamic label (Cypher 5.26+) keeps this a
+# label scan over enrichment nodes rather than a scan of the whole graph.
+_CLEAR_ENRICHMENT_Q = """\
+MATCH (n:$any($labels))
+CALL (n) { DETACH DELETE n } IN TRANSACTIONS OF 1000 ROWS"""
+
+
 def clear_enrichment_data(driver: Driver) -> None:
     """Delete all Document, Chunk, and extracted entity nodes (preserves operational graph)."""
-    labels_to_clear = ["Document", "Chunk"] + EXTRACTED_LABELS
-    deleted_total = 0
-
     print("Clearing enrichment data (Documents, Chunks, extracted entities)...")
-    for label in labels_to_clear:
-        while True:
-            records, _, _ = driver.execute_query(
-                f"MATCH (n:{label}) WITH n LIMIT 500 DETACH DELETE n RETURN count(*) AS deleted"
-            )
-            count = records[0]["deleted"]
-            deleted_total += count
-            if count == 0:
-                break
-
-    # Clean up __Entity__ and __KGBuilder__ labeled nodes left by the pipeline
-    for label in ["__Entity__", "__KGBuilder__"]:
-        while True:
-            records, _, _ = driver.execute_query(
-                f"MATCH (n:{label}) WITH n LIMIT 500 DETACH DELETE n RETURN count(*) AS deleted"
-            )
-            count = records[0]["deleted"]
-            deleted_total += count
-            if count == 0:
-                break
+    # CALL ... IN TRANSACTIONS needs an auto-commit transaction, hence
+    # session.run rather than execute_query.
+    with driver.session(default_access_mode=WRITE_ACCESS) as session:
+        summary = session.run(_CLEAR_ENRICHMENT_Q, labels=_ENRICHMENT_LABELS).consume()
 
-    print(f"  [OK] Cleared {deleted_total} enrichment nodes.")
+    print(f"  [OK] Cleared {summary.counters.nodes_deleted} enrichment nodes.")
 
 
 # ---------------------------------------------------------------------------
@@ -283,31 +535,56 @@ def clear_enrichment_data(driver: Driver) -> None:
 
 _SAMPLE_SIZE = 5
 
+# All validation samples in one round-trip: each CALL subquery aggregates to a
+# single row, so the outer RETURN yields exactly one record.
+_VALIDATION_Q = """\
+CALL () {
+    MATCH (c:Chunk)-[:FROM_DOCUMENT]->(d:Document)
+    WHERE c.embedding IS NOT NULL
+    WITH d, c LIMIT $limit
+    RETURN collect({doc: d.documentId, idx: c.index, dims: size(c.embedding)}) AS chunks
+}
+CALL () {
+    MATCH (ol:OperatingLimit)
+    WITH ol LIMIT $limit
+    RETURN collect({name: ol.name, param: ol.parameterName, aircraft: ol.aircraftType}) AS limits
+}
+CALL () {
+    MATCH (d:Document)-[:APPLIES_TO]->(a:Aircraft)
+    WITH d, a LIMIT $limit
+    RETURN collect({src: d.title, tgt: a.tail_number}) AS applies_to
+}
+CALL () {
+    MATCH (s:Sensor)-[:HAS_LIMIT]->(ol:OperatingLimit)
+    WITH s, ol LIMIT $limit
+    RETURN collect({src: s.type, tgt: ol.name}) AS has_limit
+}
+RETURN chunks, limits, applies_to, has_limit"""
+
+_VALIDATION_CROSSLINKS = [
+    ("Document -[:APPLIES_TO]-> Aircraft", "applies_to"),
+    ("Sensor -[:HAS_LIMIT]-> OperatingLimit", "has_limit"),
+]
+
 
 def validate_enrichment(driver: Driver) -> None:
     """Run sample queries to verify embeddings, entities, and cross-links."""
 
     print(f"\nValidation (sample size {_SAMPLE_SIZE}):")
 
+    records, _, _ = driver.execute_query(_VALIDATION_Q, limit=_SAMPLE_SIZE)
+    result = records[0]
+
     # 1. Chunks with embeddings linked to documents
-    rows, _, _ = driver.execute_query(f"""
-        MATCH (c:Chunk)-[:FROM_DOCUMENT]->(d:Document)
-        WHERE c.embedding IS NOT NULL
-        RETURN d.documentId AS doc, elementId(c) AS chunk_id, size(c.embedding) AS dims
-        LIMIT {_SAMPLE_SIZE}
-    """)
+    rows = result["chunks"]
     print(f"\n  Chunks with embeddings -> Document ({len(rows)} samples):")
     for r in rows:
-        print(f"    {r['chunk_id'][:12]}...  dims={r['dims']}  doc={r['doc']}")
+        print(f"    chunk {r['idx']:>3}  dims={r['dims']}  doc={r['doc']}")
     if not rows:
         print("    [WARN] No chunks with embeddings found!")
 
     # 2. OperatingLimit entities
-    rows, _, _ = driver.execute_query(f"""
-        MATCH (ol:OperatingLimit)
-        RETURN ol.name AS name, ol.parameterName AS param, ol.aircraftType AS aircraft
-        LIMIT {_SAMPLE_SIZE}
-    """)
+    rows = result["limits"]
     print(f"\n  OperatingLimit entities ({len(rows)} samples):")
     for r in rows:
         print(f"    {r['name']}  param={r['param']}  aircraft={r['aircraft']}")
@@ -315,15 +592,9 @@ def validate_enrichment(driver: Driver) -> None:
         print("    [WARN] No OperatingLimit entities found!")
 
     # 3. Cross-links to operational graph
-    queries = [
-        ("Document -[:APPLIES_TO]-> Aircraft",
-         f"MATCH (d:Document)-[:APPLIES_TO]->(a:Aircraft) RETURN d.title AS src, a.tail_number AS tgt LIMIT {_SAMPLE_SIZE}"),
-        ("Sensor -[:HAS_LIMIT]-> OperatingLimit",
-         f"MATCH (s:Sensor)-[:HAS_LIMIT]->(ol:OperatingLimit) RETURN s.type AS src, ol.name AS tgt LIMIT {_SAMPLE_SIZE}"),
-    ]
     print(f"\n  Cross-links to operational graph:")
-    for label, query in queries:
-        rows, _, _ = driver.execute_query(query)
+    for label, key in _VALIDATION_CROSSLINKS:
+        rows = result[key]
         if rows:
             pairs = ", ".join(f"{r['src']}->{r['tgt']}" for r in rows)
             print(f"    {label}: {pairs}")
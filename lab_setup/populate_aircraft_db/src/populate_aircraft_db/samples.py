@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import functools
+import io
+import sys
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+from typing import TextIO
+
 from neo4j import Driver
 
+from .schema import EXTRACTED_LABELS
+
 _W = 70
-_EXTRACTED_LABELS = ["OperatingLimit"]
 
 
 # ---------------------------------------------------------------------------
@@ -34,19 +44,16 @@ def _table(headers: list[str], rows: list[list], widths: list[int] | None = None
     if not rows:
         print("  (no results)\n")
         return
+    # Stringify each cell once; the widths and the rows below both use it.
+    text = [[str(val) if val is not None else "\u2014" for val in row] for row in rows]
     if widths is None:
-        widths = []
-        for i, h in enumerate(headers):
-            col_max = len(h)
-            for row in rows:
-                col_max = max(col_max, len(str(row[i] if i < len(row) else "")))
-            widths.append(min(col_max + 1, 50))
+        columns = zip_longest(*([headers] + text), fillvalue="")
+        widths = [min(max(map(len, col)) + 1, 50) for col in columns][: len(headers)]
     print("  " + "  ".join(h.ljust(w) for h, w in zip(headers, widths)))
     print("  " + "  ".join("\u2500" * w for w in widths))
-    for row in rows:
+    for row in text:
         cells = []
-        for val, w in zip(row, widths):
-            s = str(val) if val is not None else "\u2014"
+        for s, w in zip(row, widths):
             if len(s) > w:
                 s = s[: w - 1] + "\u2026"
             cells.append(s.ljust(w))
@@ -61,6 +68,38 @@ def _val(v, max_len: int = 0) -> str:
     return s
 
 
+# ---------------------------------------------------------------------------
+# Concurrent section execution
+# ---------------------------------------------------------------------------
+
+
+class _ThreadBufferedStdout(io.TextIOBase):
+    """``sys.stdout`` stand-in that gives each section thread its own buffer.
+
+    Sections print as they go; while they run concurrently, a thread that
+    has called :meth:`capture` writes into its own buffer and everything
+    else passes straight through to the real stdout.
+    """
+
+    def __init__(self, stdout: TextIO) -> None:
+        self._stdout = stdout
+        self._local = threading.local()
+
+    def capture(self, section: Callable[[], None]) -> str:
+        self._local.buffer = io.StringIO()
+        try:
+            section()
+            return self._local.buffer.getvalue()
+        finally:
+            del self._local.buffer
+
+    def write(self, s: str) -> int:
+        return getattr(self._local, "buffer", self._stdout).write(s)
+
+    def flush(self) -> None:
+        self._stdout.flush()
+
+
 # ---------------------------------------------------------------------------
 # 1. Aircraft Fleet (shows all — not limited by sample_size)
 # ---------------------------------------------------------------------------
@@ -112,16 +151,20 @@ def _system_hierarchy(driver: Driver) -> None:
         print("  (no results)\n")
         return
     r = rows[0]
-    print(f"  Aircraft {r['tail']} ({r['model']})")
+    lines = [f"  Aircraft {r['tail']} ({r['model']})"]
     systems = r["systems"]
-    for i, sys in enumerate(systems):
-        last_sys = i == len(systems) - 1
-        print(f"  {'└── ' if last_sys else '├── '}{sys['system']}")
-        for j, comp in enumerate(sys["components"]):
-            branch = "    " if last_sys else "│   "
-            leaf = "└── " if j == len(sys["components"]) - 1 else "├── "
-            print(f"  {branch}{leaf}{comp}")
-    print()
+    last_sys = len(systems) - 1
+    for i, system in enumerate(systems):
+        branch = "    " if i == last_sys else "│   "
+        lines.append(f"  {'└── ' if i == last_sys else '├── '}{system['system']}")
+        comps = system["components"]
+        last_comp = len(comps) - 1
+        lines.extend(
+            f"  {branch}{'└── ' if j == last_comp else '├── '}{comp}"
+            for j, comp in enumerate(comps)
+        )
+    # One write for the whole tree instead of a print per line.
+    print("\n".join(lines) + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -263,14 +306,16 @@ def _document_chunks(driver: Driver, limit: int) -> None:
 # 7. Extracted entities
 # ---------------------------------------------------------------------------
 
-_ENTITIES_Q = """\
-UNWIND $labels AS label
-CALL (label) {
-    MATCH (n) WHERE label IN labels(n)
-    RETURN n.name AS name
-    LIMIT $limit
-}
-RETURN label AS entity_type, collect(name) AS samples"""
+# One label-scoped branch per entity type, so each sample is read through the
+# label index rather than by testing labels(n) on every node in the graph.
+_ENTITIES_Q = (
+    "CALL () {\n"
+    + "\n    UNION ALL\n".join(
+        f"    MATCH (n:`{label}`) RETURN '{label}' AS label, n.name AS name LIMIT $limit"
+        for label in EXTRACTED_LABELS
+    )
+    + "\n}\nRETURN label AS entity_type, collect(name) AS samples"
+)
 
 
 def _extracted_entities(driver: Driver, limit: int) -> None:
@@ -279,7 +324,7 @@ def _extracted_entities(driver: Driver, limit: int) -> None:
         "Entity types extracted from maintenance manuals via SimpleKGPipeline.",
     )
     _cypher(_ENTITIES_Q)
-    rows, _, _ = driver.execute_query(_ENTITIES_Q, labels=_EXTRACTED_LABELS, limit=limit)
+    rows, _, _ = driver.execute_query(_ENTITIES_Q, limit=limit)
     if not rows or all(len(r["samples"]) == 0 for r in rows):
         print("  (no extracted entities \u2014 run 'enrich' first)\n")
         return
@@ -401,15 +446,29 @@ def run_all_samples(driver: Driver, sample_size: int = 10) -> None:
     print(f"{'#' * _W}")
     print(f"\n  Sample size: {sample_size} rows per section\n")
 
-    _aircraft_fleet(driver)
-    _system_hierarchy(driver)
-    _flight_operations(driver, sample_size)
-    _maintenance_events(driver, sample_size)
-    _sensors(driver, sample_size)
-    _document_chunks(driver, sample_size)
-    _extracted_entities(driver, sample_size)
-    _cross_links(driver, sample_size)
-    _vector_similarity(driver, sample_size)
+    # The sections are read-only and independent, so they run concurrently;
+    # each one's output is buffered and printed in section order.
+    sections: list[Callable[[], None]] = [
+        functools.partial(_aircraft_fleet, driver),
+        functools.partial(_system_hierarchy, driver),
+        functools.partial(_flight_operations, driver, sample_size),
+        functools.partial(_maintenance_events, driver, sample_size),
+        functools.partial(_sensors, driver, sample_size),
+        functools.partial(_document_chunks, driver, sample_size),
+        functools.partial(_extracted_entities, driver, sample_size),
+        functools.partial(_cross_links, driver, sample_size),
+        functools.partial(_vector_similarity, driver, sample_size),
+    ]
+    stdout = sys.stdout
+    buffered = _ThreadBufferedStdout(stdout)
+    sys.stdout = buffered
+    try:
+        with ThreadPoolExecutor(max_workers=len(sections)) as pool:
+            outputs = [pool.submit(buffered.capture, section) for section in sections]
+            for future in outputs:
+                stdout.write(future.result())
+    finally:
+        sys.stdout = stdout
 
     print(f"{'#' * _W}")
     print("  All samples complete.")
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from neo4j import Driver
+import functools
+
+from neo4j import Driver, Session
+from neo4j.exceptions import Neo4jError
 
 # (label, property) pairs — one uniqueness constraint each.
 CONSTRAINTS: list[tuple[str, str]] = [
@@ -23,8 +26,13 @@ INDEXES: list[tuple[str, str]] = [
     ("MaintenanceEvent", "severity"),
     ("Flight", "aircraft_id"),
     ("Removal", "aircraft_id"),
+    ("Aircraft", "model"),
 ]
 
+# Labels of the entity nodes the `enrich` command extracts.  The pipeline
+# clears and validates these and `samples` lists them.
+EXTRACTED_LABELS: list[str] = ["OperatingLimit"]
+
 # Constraints for entity types created by the `enrich` command.
 # SimpleKGPipeline deduplicates on the `name` property.
 EXTRACTION_CONSTRAINTS: list[tuple[str, str]] = [
@@ -32,32 +40,121 @@ EXTRACTION_CONSTRAINTS: list[tuple[str, str]] = [
 ]
 
 
-def create_constraints(driver: Driver) -> None:
-    """Create uniqueness constraints (idempotent)."""
-    for label, prop in CONSTRAINTS:
-        driver.execute_query(
-            f"CREATE CONSTRAINT IF NOT EXISTS FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE"
-        )
-        print(f"  [OK] Constraint: {label}.{prop}")
+# (label, properties) pairs — composite indexes backing the `enrich`
+# cross-link joins in pipeline.link_to_existing_graph.
+LINK_INDEXES: list[tuple[str, tuple[str, ...]]] = [
+    ("OperatingLimit", ("parameterName", "aircraftType")),
+]
 
 
-def create_indexes(driver: Driver) -> None:
-    """Create property indexes (idempotent)."""
-    for label, prop in INDEXES:
-        index_name = f"idx_{label.lower()}_{prop.lower()}"
-        driver.execute_query(
-            f"CREATE INDEX {index_name} IF NOT EXISTS FOR (n:{label}) ON (n.{prop})"
+# Schema objects are identified as ("constraint", label, properties) for
+# uniqueness constraints and ("index", label, properties) for range indexes.
+# Matching on the schema rather than the name also recognises the unnamed
+# indexes older loads created.
+_SchemaKey = tuple
+
+
+def _existing_schema(session: Session) -> set[_SchemaKey]:
+    """Return the keys of the schema objects already in the database.
+
+    One ``SHOW INDEXES`` covers both kinds: a uniqueness constraint shows up
+    as the range index that backs it, which also serves lookups on the same
+    properties.  If the listing fails (e.g. the user lacks the privilege),
+    nothing is assumed to exist.
+    """
+    try:
+        records = list(session.run(
+            "SHOW INDEXES YIELD type, labelsOrTypes, properties, owningConstraint"
+            " WHERE type = 'RANGE'"
+        ))
+    except Exception:
+        return set()
+    existing: set[_SchemaKey] = set()
+    for r in records:
+        if not (r["labelsOrTypes"] and r["properties"]):
+            continue
+        schema = (r["labelsOrTypes"][0], tuple(r["properties"]))
+        existing.add(("index", *schema))
+        if r["owningConstraint"]:
+            existing.add(("constraint", *schema))
+    return existing
+
+
+def _run_all(tx, statements: list[str]) -> None:
+    for cypher in statements:
+        tx.run(cypher).consume()
+
+
+def _run_schema(driver: Driver, statements: list[tuple[_SchemaKey, str, str]]) -> None:
+    """Run ``(key, cypher, description)`` DDL statements in one write transaction.
+
+    Statements whose object already exists are skipped, so re-running on a
+    populated database costs one ``SHOW INDEXES`` and no write transaction.
+    """
+    # One session (and pooled connection) for both the listing and the DDL.
+    with driver.session() as session:
+        existing = _existing_schema(session)
+        missing = [cypher for key, cypher, _ in statements if key not in existing]
+        if missing:
+            session.execute_write(_run_all, missing)
+    for _, _, description in statements:
+        print(f"  [OK] {description}")
+
+
+def _unique_constraints(pairs: list[tuple[str, str]]) -> list[tuple[_SchemaKey, str, str]]:
+    return [
+        (
+            ("constraint", label, (prop,)),
+            f"CREATE CONSTRAINT IF NOT EXISTS FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE",
+            f"Constraint: {label}.{prop}",
         )
-        print(f"  [OK] Index: {label}.{prop}")
+        for label, prop in pairs
+    ]
+
+
+def _indexes(pairs: list[tuple[str, tuple[str, ...]]]) -> list[tuple[_SchemaKey, str, str]]:
+    statements = []
+    for label, props in pairs:
+        name = f"idx_{label.lower()}_{'_'.join(p.lower() for p in props)}"
+        statements.append((
+            ("index", label, tuple(props)),
+            f"CREATE INDEX {name} IF NOT EXISTS "
+            f"FOR (n:{label}) ON ({', '.join(f'n.{p}' for p in props)})",
+            f"Index: {label}.{props[0]}" if len(props) == 1 else f"Index: {label}({', '.join(props)})",
+        ))
+    return statements
+
+
+# DDL for each table above, rendered once at import.
+_CONSTRAINT_DDL = _unique_constraints(CONSTRAINTS)
+_INDEX_DDL = _indexes([(label, (prop,)) for label, prop in INDEXES])
+_LINK_INDEX_DDL = _indexes(LINK_INDEXES)
+_EXTRACTION_CONSTRAINT_DDL = _unique_constraints(EXTRACTION_CONSTRAINTS)
+
+
+def create_schema(driver: Driver) -> None:
+    """Create the operational graph's uniqueness constraints and property indexes (idempotent).
+
+    Both are listed and committed on one session in one transaction.
+    """
+    _run_schema(driver, _CONSTRAINT_DDL + _INDEX_DDL)
+
+
+def create_link_indexes(driver: Driver) -> None:
+    """Create composite indexes for the cross-link join keys (idempotent).
+
+    Waits for them to come online: a freshly created index is still
+    POPULATING and would not be used by the link queries that follow.
+    """
+    _run_schema(driver, _LINK_INDEX_DDL)
+    # awaitIndexes rather than awaitIndex by name: on databases from older
+    # loads the matching index may exist under a generated name.
+    driver.execute_query("CALL db.awaitIndexes(300)")
 
 
 def create_extraction_constraints(driver: Driver) -> None:
     """Create uniqueness constraints for extracted entity types (idempotent)."""
-    for label, prop in EXTRACTION_CONSTRAINTS:
-        driver.execute_query(
-            f"CREATE CONSTRAINT IF NOT EXISTS FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE"
-        )
-        print(f"  [OK] Constraint: {label}.{prop}")
+    _run_schema(driver, _EXTRACTION_CONSTRAINT_DDL)
 
 
 def create_embedding_indexes(driver: Driver, dimensions: int) -> None:
@@ -85,13 +182,43 @@ def create_embedding_indexes(driver: Driver, dimensions: int) -> None:
     )
     print("  [OK] Fulltext index: maintenanceChunkText")
 
+    _warm_vector_index(driver, dimensions)
+
+
+def _warm_vector_index(driver: Driver, dimensions: int) -> None:
+    """Wait for the vector index to come online, then run one throwaway search.
+
+    The search pages the HNSW graph into the server's cache, so the first
+    real similarity query (e.g. in ``samples``) does not pay for it.  The
+    probe is a unit vector because cosine similarity rejects a zero vector.
+
+    Warming is optional: if it fails (e.g. an existing index was created
+    with different dimensions), a warning is printed and enrich carries on.
+    """
+    probe = [1.0] + [0.0] * (dimensions - 1)
+    try:
+        driver.execute_query("CALL db.awaitIndex('maintenanceChunkEmbeddings', 300)")
+        driver.execute_query(
+            "CALL db.index.vector.queryNodes('maintenanceChunkEmbeddings', 10, $probe)"
+            " YIELD node RETURN count(node) AS warmed",
+            probe=probe,
+        )
+    except Neo4jError as exc:
+        print(f"  [WARN] Vector index not warmed: {exc.message or exc}")
+        return
+    print("  [OK] Vector index warmed")
+
 
+@functools.cache
 def build_extraction_schema():
     """Build a GraphSchema for SimpleKGPipeline entity extraction.
 
     Only extracts OperatingLimit entities.  Entity names are qualified
     with aircraft type (e.g. ``EGT - A320-200``) so that entity
     resolution does not merge limits from different aircraft.
+
+    Cached: the pipeline and :func:`build_extraction_response_format` both
+    need it, and pydantic validation makes each build non-trivial.
     """
     from neo4j_graphrag.experimental.components.schema import (
         GraphSchema,
@@ -136,3 +263,98 @@ def build_extraction_schema():
         additional_relationship_types=False,
         additional_patterns=False,
     )
+
+
+# Property types that map cleanly onto a JSON Schema type.  Temporal,
+# spatial and list types have no strict-mode equivalent.
+_JSON_TYPES = {
+    "STRING": "string",
+    "INTEGER": "integer",
+    "FLOAT": "number",
+    "BOOLEAN": "boolean",
+}
+
+
+def _json_type(property_type) -> str:
+    try:
+        return _JSON_TYPES[property_type.type]
+    except KeyError:
+        raise ValueError(
+            f"Property {property_type.name!r} has type {property_type.type!r}, "
+            f"which has no JSON Schema mapping; use one of {sorted(_JSON_TYPES)}."
+        ) from None
+
+
+def build_extraction_response_format() -> dict:
+    """Build an OpenAI ``response_format`` that pins extraction output to the graph shape.
+
+    Mirrors the ``{"nodes": [...], "relationships": [...]}`` JSON the
+    entity extractor parses, with node properties taken from
+    :func:`build_extraction_schema`.
+
+    Strict mode requires every property to be listed as required, so only
+    ``name`` (the entity-resolution key) must hold a value; the others may
+    be ``null`` when a chunk does not mention them.  The extractor rejects
+    ``null`` property values, so the pipeline strips them from each reply
+    (see ``pipeline._drop_null_properties``) before it is parsed.
+    """
+    schema = build_extraction_schema()
+
+    node_variants = []
+    for node_type in schema.node_types:
+        props = {
+            p.name: {
+                "type": _json_type(p) if p.name == "name" else [_json_type(p), "null"],
+                "description": p.description,
+            }
+            for p in node_type.properties
+        }
+        node_variants.append({
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "label": {"type": "string", "enum": [node_type.label]},
+                "properties": {
+                    "type": "object",
+                    "properties": props,
+                    "required": list(props),
+                    "additionalProperties": False,
+                },
+            },
+            "required": ["id", "label", "properties"],
+            "additionalProperties": False,
+        })
+
+    relationship = {
+        "type": "object",
+        "properties": {
+            "type": {"type": "string"},
+            "start_node_id": {"type": "string"},
+            "end_node_id": {"type": "string"},
+            "properties": {
+                "type": "object",
+                "properties": {},
+                "required": [],
+                "additionalProperties": False,
+            },
+        },
+        "required": ["type", "start_node_id", "end_node_id", "properties"],
+        "additionalProperties": False,
+    }
+
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "extracted_graph",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "nodes": {"type": "array", "items": {"anyOf": node_variants}},
+                    "relationships": {"type": "array", "items": relationship},
+                },
+                "required": ["nodes", "relationships"],
+                "additionalProperties": False,
+            },
+        },
+    }
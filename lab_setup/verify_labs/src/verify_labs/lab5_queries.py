@@ -9,21 +9,35 @@ from .query_runner import QuerySpec
 NOTEBOOK_01: list[QuerySpec] = [
     QuerySpec(
         name="Node counts by label",
-        description="Count nodes grouped by label (Aircraft, System, Component, …)",
+        description="Count nodes grouped by label (Aircraft, System, Component)",
         notebook="01",
+        # Per-label counts come from the counts store instead of a full node
+        # scan; empty labels are dropped so an empty graph still fails.
         cypher="""\
-MATCH (n)
-RETURN labels(n)[0] AS NodeType, count(*) AS Count
+CALL () {
+    MATCH (n:Aircraft) RETURN 'Aircraft' AS NodeType, count(n) AS Count
+    UNION ALL
+    MATCH (n:Component) RETURN 'Component' AS NodeType, count(n) AS Count
+    UNION ALL
+    MATCH (n:System) RETURN 'System' AS NodeType, count(n) AS Count
+}
+WITH NodeType, Count WHERE Count > 0
+RETURN NodeType, Count
 ORDER BY NodeType""",
         min_rows=1,
     ),
     QuerySpec(
         name="Relationship counts by type",
-        description="Count relationships grouped by type (HAS_SYSTEM, HAS_COMPONENT, …)",
+        description="Count relationships grouped by type (HAS_SYSTEM, HAS_COMPONENT)",
         notebook="01",
         cypher="""\
-MATCH ()-[r]->()
-RETURN type(r) AS RelType, count(*) AS Count
+CALL () {
+    MATCH ()-[r:HAS_COMPONENT]->() RETURN 'HAS_COMPONENT' AS RelType, count(r) AS Count
+    UNION ALL
+    MATCH ()-[r:HAS_SYSTEM]->() RETURN 'HAS_SYSTEM' AS RelType, count(r) AS Count
+}
+WITH RelType, Count WHERE Count > 0
+RETURN RelType, Count
 ORDER BY RelType""",
         min_rows=1,
     ),
@@ -32,7 +46,7 @@ ORDER BY RelType""",
         description="Systems and components for tail number N95040A",
         notebook="01",
         cypher="""\
-MATCH (a:Aircraft {tail_number: 'N95040A'})-[:HAS_SYSTEM]->(s:System)
+MATCH (a:Aircraft {tail_number: $tail_number})-[:HAS_SYSTEM]->(s:System)
 WHERE s.type IS NOT NULL AND s.name IS NOT NULL
 OPTIONAL MATCH (s)-[:HAS_COMPONENT]->(c:Component)
 RETURN a.tail_number AS Aircraft,
@@ -41,6 +55,7 @@ RETURN a.tail_number AS Aircraft,
        s.type AS SystemType,
        collect(c.name) AS Components
 ORDER BY s.type, s.name""",
+        params={"tail_number": "N95040A"},
         min_rows=1,
     ),
     QuerySpec(
@@ -70,11 +85,12 @@ ORDER BY Count DESC""",
         description="Full hierarchy for N95040A (adapted from visualization query)",
         notebook="01",
         cypher="""\
-MATCH (a:Aircraft {tail_number: 'N95040A'})-[:HAS_SYSTEM]->(s:System)-[:HAS_COMPONENT]->(c:Component)
+MATCH (a:Aircraft {tail_number: $tail_number})-[:HAS_SYSTEM]->(s:System)-[:HAS_COMPONENT]->(c:Component)
 WHERE s.type IS NOT NULL AND s.name IS NOT NULL AND c.name IS NOT NULL
 RETURN a.tail_number AS Aircraft, s.name AS System, s.type AS SystemType,
        c.name AS Component, c.type AS ComponentType
 ORDER BY s.type, s.name, c.name""",
+        params={"tail_number": "N95040A"},
         min_rows=1,
     ),
     QuerySpec(
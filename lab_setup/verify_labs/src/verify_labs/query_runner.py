@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Any
 
-from neo4j import Driver
+from neo4j import Driver, Record, Result
 from rich.console import Console
 from rich.table import Table
 
 console = Console()
 
+# Rows kept per result and shown in its table.
+DISPLAY_ROWS = 20
+
 
 @dataclass
 class QuerySpec:
@@ -20,6 +24,7 @@ class QuerySpec:
     cypher: str
     notebook: str  # e.g. "01" or "02"
     min_rows: int = 1
+    params: dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -29,17 +34,36 @@ class QueryResult:
     spec: QuerySpec
     passed: bool = False
     row_count: int = 0
-    rows: list[dict] = field(default_factory=list)
+    rows: list[Record] = field(default_factory=list)  # first DISPLAY_ROWS only
     error: str | None = None
 
 
+def _first_rows(records: Result) -> tuple[list[Record], int]:
+    """Count every record but keep only the first ``DISPLAY_ROWS``.
+
+    The kept Records are used as-is; :func:`display_result` reads them
+    through ``keys()`` and ``values()``, so no dict copy is made.
+    """
+    rows: list[Record] = []
+    count = 0
+    for record in records:
+        if count < DISPLAY_ROWS:
+            rows.append(record)
+        count += 1
+    return rows, count
+
+
 def run_query(driver: Driver, spec: QuerySpec) -> QueryResult:
-    """Execute *spec* and return a QueryResult."""
+    """Execute *spec* and return a QueryResult.
+
+    Records are streamed, so only the rows :func:`display_result` shows are
+    ever held in memory.
+    """
     result = QueryResult(spec=spec)
     try:
-        records, _, _ = driver.execute_query(spec.cypher)
-        result.rows = [dict(r) for r in records]
-        result.row_count = len(result.rows)
+        result.rows, result.row_count = driver.execute_query(
+            spec.cypher, spec.params, result_transformer_=_first_rows
+        )
         result.passed = result.row_count >= spec.min_rows
     except Exception as exc:
         result.error = str(exc)
@@ -63,14 +87,28 @@ def display_result(result: QueryResult) -> None:
         console.print("  (no rows returned)")
         return
 
-    # Build a rich table from the first ≤20 rows
     columns = list(result.rows[0].keys())
+    # Every Record has the columns in the same order, so its values can be
+    # stringified in one map instead of looking each key up again.
+    cells = [list(map(str, row.values())) for row in result.rows]
+
+    # Piped to a file or CI log: skip Rich's table layout, which nobody sees.
+    if not console.is_terminal:
+        lines = ["\t".join(columns)]
+        lines.extend("\t".join(row) for row in cells)
+        if result.row_count > DISPLAY_ROWS:
+            lines.append("...")
+        print("\n".join(lines))
+        print(f"  ({result.row_count} row(s))")
+        return
+
+    # Build a rich table from the first ≤DISPLAY_ROWS rows
     table = Table(show_lines=False, pad_edge=False)
     for col in columns:
         table.add_column(col)
-    for row in result.rows[:20]:
-        table.add_row(*(str(row[c]) for c in columns))
-    if result.row_count > 20:
+    for row in cells:
+        table.add_row(*row)
+    if result.row_count > DISPLAY_ROWS:
         table.add_row(*["..." for _ in columns])
 
     console.print(table)